@@ -5,29 +5,130 @@ Creates a weekly playlist and adds new songs by specified artists from the last
 Uses actual Spotify release date filtering instead of text matching.
 """
 
+import asyncio
+import itertools
 import json
-import subprocess
+import os
+import random
 import sys
 import re
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
+try:
+    # orjson reads and writes the large MCP payloads ~3-5x faster than
+    # stdlib json and works directly on the raw bytes from the pipe
+    from orjson import dumps as json_dumps_bytes, loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+    def json_dumps_bytes(obj):
+        return json.dumps(obj).encode()
+
 
 # Configure your favorite artists here
-FAVORITE_ARTISTS = [
+FAVORITE_ARTISTS = (
     "Lil Tecca",
-    "Playboi Carti", 
+    "Playboi Carti",
     "Travis Scott",
     "Gunna",
     "Future",
     "PlaqueBoyMax",
     "4batz"
-]
+)
+
+# Cap concurrent in-flight searches so we don't hammer the Spotify API
+SEARCH_CONCURRENCY = 4
+
+# Pace searches to ~10/second with a burst of 10 to stay under Spotify's
+# (undocumented) 429 threshold
+SEARCH_RATE = 10.0
+SEARCH_BURST = 10
+SEARCH_RETRIES = 3
+SEARCH_BACKOFF_BASE = 0.5
+
+# Stop searching an artist once this many recent tracks are found - the
+# remaining broader queries mostly return duplicates
+MAX_TRACKS_PER_ARTIST = 3
+
+# Cache of search results that repeat week over week, so steady-state
+# runs can skip tracks already known to be older than the cutoff
+CACHE_PATH = Path.home() / ".cache" / "weekly_drops.json"
+MAX_CACHED_TRACKS = 5000
+
+# Stream buffer limit for reading server responses. The MCP stdio
+# transport is newline-delimited JSON, and a limit=50 search response is
+# tens of KB on one line - well past asyncio's 64 KiB default, which
+# would make readline() raise and desync the pipe.
+STREAM_LIMIT = 2 ** 20
+
+# Track lines look like:
+# 1. "Title" by Artist (duration) - Released: YYYY-MM-DD - ID: track_id
+# Compiled once at import; re.ASCII is safe since the fields we capture
+# delimiters on are plain ASCII digits/letters. MULTILINE anchors ^ at
+# every line start, so the whole response is scanned in one sweep.
+_TRACK_RE = re.compile(
+    r'^\d+\.\s*"([^"\n]+)"\s+by\s+([^(\n]+)\s*\([^)\n]+\)\s*-\s*Released:\s*([0-9]{4}(?:-[0-9]{2}(?:-[0-9]{2})?)?|Unknown)\s*-\s*ID:\s*([a-zA-Z0-9]+)',
+    re.ASCII | re.MULTILINE
+)
+
+_PLAYLIST_ID_RE = re.compile(r'Playlist ID: ([a-zA-Z0-9]+)', re.ASCII)
+
+# Artist search results look like: "1. Name - ID: artist_id"
+_ARTIST_RE = re.compile(r'^\d+\.\s*(.+?)\s*-\s*ID:\s*([a-zA-Z0-9]+)\s*$',
+                        re.ASCII | re.MULTILINE)
+
+# Precompiled, escaped substring matchers for the configured artists,
+# so multi-word names like "Lil Tecca" are matched literally; these
+# also allow checking one broad response against every artist at once
+_ARTIST_MATCHERS = {
+    name: re.compile(re.escape(name.lower())) for name in FAVORITE_ARTISTS
+}
+
+# Prebuilt frame for the hot searchSpotify call - only the id and the
+# (json-escaped) query change between requests, so skip json.dumps on
+# the constant envelope
+_SEARCH_TEMPLATE = (
+    '{"jsonrpc":"2.0","id":%d,"method":"tools/call",'
+    '"params":{"name":"searchSpotify",'
+    '"arguments":{"query":%s,"type":"track","limit":50}}}\n'
+)
+
+
+def load_cache():
+    """Load the persistent run cache (known-old track release dates)."""
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            cache = json_loads(f.read())
+    except (OSError, ValueError):
+        cache = {}
+    cache.setdefault('tracks', {})
+    cache.setdefault('artists', {})
+    return cache
+
+
+def save_cache(cache):
+    """Atomically rewrite the run cache, bounding its size."""
+    tracks = cache['tracks']
+    if len(tracks) > MAX_CACHED_TRACKS:
+        # Keep the most recently added entries (dicts preserve insertion
+        # order) so the cache can't grow without bound across weeks
+        cache['tracks'] = dict(list(tracks.items())[-MAX_CACHED_TRACKS:])
+
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CACHE_PATH.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(json_dumps_bytes(cache))
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError as e:
+        print(f"⚠️  Could not save run cache: {e}")
 
 
 def get_week_dates():
     """Get the current week's start and end dates."""
-    today = datetime.now()
+    today = date.today()
     start_of_week = today - timedelta(days=today.weekday())
     end_of_week = start_of_week + timedelta(days=6)
     return start_of_week, end_of_week
@@ -35,7 +136,7 @@ def get_week_dates():
 
 def get_cutoff_date():
     """Get the cutoff date for recent releases (7 days ago)."""
-    return datetime.now() - timedelta(days=7)
+    return date.today() - timedelta(days=7)
 
 
 def generate_playlist_name():
@@ -44,142 +145,370 @@ def generate_playlist_name():
     return f"Weekly New Drops - {start_week.strftime('%b %d')} to {end_week.strftime('%b %d, %Y')}"
 
 
-def send_mcp_request(process, request_id, method, params=None):
-    """Send an MCP request to the server process."""
-    request = {
-        "jsonrpc": "2.0",
-        "id": request_id,
-        "method": method
-    }
-    if params:
-        request["params"] = params
-    
-    request_json = json.dumps(request)
-    
-    process.stdin.write(request_json + '\n')
-    process.stdin.flush()
-    
-    # Read response
-    response_line = process.stdout.readline()
-    
-    try:
-        return json.loads(response_line)
-    except json.JSONDecodeError as e:
-        print(f"❌ Failed to parse response: {e}")
-        return None
+class RateLimiter:
+    """Token-bucket limiter that paces outgoing search requests."""
 
+    def __init__(self, rate=SEARCH_RATE, burst=SEARCH_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
 
-def extract_playlist_id(response_text):
-    """Extract playlist ID from create playlist response."""
-    match = re.search(r'Playlist ID: ([a-zA-Z0-9]+)', response_text)
-    return match.group(1) if match else None
+    async def acquire(self):
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
 
 
-def extract_track_info_with_dates(search_text):
-    """Extract track information including release dates from search response."""
-    tracks = []
-    for line in search_text.split('\n'):
-        # Look for lines with track info including release date:
-        # "Title" by Artist (duration) - Released: YYYY-MM-DD - ID: track_id
-        match = re.search(
-            r'^\d+\.\s*"([^"]+)"\s+by\s+([^(]+)\s*\([^)]+\)\s*-\s*Released:\s*([0-9]{4}-[0-9]{2}-[0-9]{2}|[0-9]{4}-[0-9]{2}|[0-9]{4}|Unknown)\s*-\s*ID:\s*([a-zA-Z0-9]+)', 
-            line
-        )
+class MCPClient:
+    """JSON-RPC client that multiplexes requests over one MCP server process.
+
+    Requests are written to the server's stdin and matched back up with
+    responses by JSON-RPC id, so any number of requests can be in flight
+    at once over the single stdio pipe.
+    """
+
+    def __init__(self, process):
+        self.process = process
+        self._pending = {}
+        self._next_id = itertools.count(1)
+        self._reader_task = None
+        self._closed = False
+
+    def start(self):
+        """Start the background task that reads server responses."""
+        self._reader_task = asyncio.create_task(self._read_responses())
+
+    async def _read_responses(self):
+        try:
+            while True:
+                try:
+                    line = await self.process.stdout.readline()
+                except (ValueError, OSError) as e:
+                    # A response line over STREAM_LIMIT (or a broken pipe)
+                    # desyncs the stream; stop reading so the pending
+                    # futures fail instead of the task dying silently
+                    print(f"❌ Failed to read response: {e}")
+                    break
+                if not line:
+                    break
+                # Cheap bytes-level check: anything that isn't a JSON object
+                # (stray server logging on stdout) isn't worth parsing
+                if not line.lstrip().startswith(b'{'):
+                    continue
+                try:
+                    message = json_loads(line)
+                except ValueError as e:
+                    print(f"❌ Failed to parse response: {e}")
+                    continue
+                future = self._pending.pop(message.get("id"), None)
+                if future and not future.done():
+                    future.set_result(message)
+        finally:
+            # EOF or reader failure: anything still waiting for a
+            # response would otherwise hang forever
+            self._fail_pending()
+
+    def _fail_pending(self):
+        """Resolve outstanding requests with None once the pipe is dead."""
+        self._closed = True
+        for future in self._pending.values():
+            if not future.done():
+                future.set_result(None)
+        self._pending.clear()
+
+    async def send_mcp_request(self, method, params=None):
+        """Send an MCP request to the server process and await its response."""
+        if self._closed:
+            return None  # Server is gone; degrade like a failed request
+
+        request_id = next(self._next_id)
+        request = {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": method
+        }
+        if params:
+            request["params"] = params
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        # One pre-encoded frame per write so the whole request (newline
+        # included) hits the pipe in a single syscall
+        frame = json_dumps_bytes(request) + b'\n'
+        self.process.stdin.write(frame)
+        await self.process.stdin.drain()
+
+        return await future
+
+    async def send_search(self, query):
+        """Fast path for searchSpotify calls via the prebuilt template.
+
+        json.dumps is still used on the query itself so quotes and
+        backslashes are escaped safely.
+        """
+        if self._closed:
+            return None  # Server is gone; degrade like a failed request
+
+        request_id = next(self._next_id)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        frame = (_SEARCH_TEMPLATE % (request_id, json.dumps(query))).encode()
+        self.process.stdin.write(frame)
+        await self.process.stdin.drain()
+
+        return await future
+
+    async def close(self):
+        """Stop the reader task and drop any pending requests."""
+        if self._reader_task:
+            self._reader_task.cancel()
+        self._fail_pending()
+
+
+async def search_spotify(client, limiter, query):
+    """Run a rate-limited searchSpotify call, backing off on errors."""
+    response = None
+    for attempt in range(SEARCH_RETRIES):
+        await limiter.acquire()
+        response = await client.send_search(query)
+        if response and "error" not in response:
+            return response
+        if attempt + 1 < SEARCH_RETRIES:
+            # Exponential backoff with jitter in case the server hit a 429
+            delay = SEARCH_BACKOFF_BASE * (2 ** attempt) + random.uniform(0, 0.1)
+            print(f"  ⏳ Search for '{query}' failed, retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+    return response
+
+
+async def resolve_artist(client, limiter, artist, artist_cache):
+    """Resolve an artist's canonical Spotify name and ID, cached across runs.
+
+    The stable ID only has to be looked up once per artist, ever. The MCP
+    server doesn't expose an albums-by-artist tool yet, so for now the ID
+    is just persisted and the canonical name sharpens the track queries.
+    """
+    cached = artist_cache.get(artist)
+    if cached:
+        return cached
+
+    await limiter.acquire()
+    response = await client.send_mcp_request("tools/call", {
+        "name": "searchSpotify",
+        "arguments": {
+            "query": artist,
+            "type": "artist",
+            "limit": 1
+        }
+    })
+
+    if response and "result" in response:
+        match = _ARTIST_RE.search(response["result"]["content"][0]["text"])
         if match:
-            title, artist, release_date, track_id = match.groups()
-            tracks.append({
-                'title': title.strip(),
-                'artist': artist.strip(),
-                'release_date': release_date.strip(),
-                'id': track_id.strip()
-            })
-    return tracks
+            resolved = {"name": match.group(1), "id": match.group(2)}
+            artist_cache[artist] = resolved
+            return resolved
+
+    return None
+
+
+def extract_playlist_id(response_text):
+    """Extract playlist ID from create playlist response."""
+    match = _PLAYLIST_ID_RE.search(response_text)
+    return match.group(1) if match else None
 
 
 def parse_spotify_date(date_str):
-    """Parse Spotify release date string to datetime object."""
+    """Parse Spotify release date string to a date object."""
     date_str = date_str.strip()
-    
+
     if date_str == 'Unknown':
         return None
-    
+
     try:
-        # Spotify dates can be YYYY-MM-DD, YYYY-MM, or YYYY
-        if len(date_str) == 10:  # YYYY-MM-DD
-            return datetime.strptime(date_str, '%Y-%m-%d')
-        elif len(date_str) == 7:  # YYYY-MM
-            return datetime.strptime(date_str + '-01', '%Y-%m-%d')
-        elif len(date_str) == 4:  # YYYY
-            return datetime.strptime(date_str + '-01-01', '%Y-%m-%d')
+        # Spotify dates can be YYYY-MM-DD, YYYY-MM, or YYYY.
+        # Slice the fields directly instead of going through strptime's
+        # locale-aware machinery - the formats are fixed-width. A plain
+        # date is all the comparison path needs; the time of day never
+        # mattered.
+        n = len(date_str)
+        if n == 10:  # YYYY-MM-DD
+            return date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        elif n == 7:  # YYYY-MM
+            return date(int(date_str[0:4]), int(date_str[5:7]), 1)
+        elif n == 4:  # YYYY
+            return date(int(date_str), 1, 1)
     except ValueError:
         pass
-    
+
     return None
 
 
-def is_recent_release(release_date_str, cutoff_date):
+def is_recent_release(release_date_str, cutoff_date, cutoff_ymd=None):
     """Check if a release date is within the last 7 days."""
-    release_date = parse_spotify_date(release_date_str)
-    
-    if not release_date:
+    release_date_str = release_date_str.strip()
+
+    if len(release_date_str) < 10:
+        # Year- and month-precision dates floor to Jan 1 / the 1st, so
+        # they can only qualify when the 7-day window touches the first
+        # week of a month - on either end, since the cutoff itself may
+        # sit late in the previous month. Only parse in that corner case.
+        if cutoff_date.day > 7 and (cutoff_date + timedelta(days=7)).day > 7:
+            return False
+        release_date = parse_spotify_date(release_date_str)
+        return release_date is not None and release_date >= cutoff_date
+
+    # YYYY-MM-DD fast path: tuple comparison, no datetime construction
+    try:
+        ymd = (int(release_date_str[0:4]),
+               int(release_date_str[5:7]),
+               int(release_date_str[8:10]))
+    except ValueError:
         return False
-    
-    return release_date >= cutoff_date
 
+    if cutoff_ymd is None:
+        cutoff_ymd = (cutoff_date.year, cutoff_date.month, cutoff_date.day)
+    return ymd >= cutoff_ymd
 
-def search_artist_tracks(process, request_id, artist):
-    """Search for tracks by an artist and filter by release date."""
-    print(f"  🔍 Searching for tracks by {artist}...")
-    
-    cutoff_date = get_cutoff_date()
-    found_tracks = []
-    seen_track_ids = set()  # Track IDs we've already seen
+
+async def search_artist_tracks(client, artist, semaphore, limiter, known_old,
+                               artist_cache, cutoff_date, cutoff_ymd):
+    """Search for tracks by an artist and filter by release date.
+
+    `known_old` maps track IDs to release dates that earlier runs already
+    determined were past the cutoff; matching tracks are skipped without
+    re-parsing, and newly-seen old tracks are added for next week's run.
+    The cutoff is computed once by the caller so every artist filters
+    against the same instant.
+    """
+    # Buffer this artist's log lines and write them in one go at the end,
+    # both to avoid a syscall per line and to keep concurrent artists'
+    # output from interleaving
+    log_lines = [f"  🔍 Searching for tracks by {artist}..."]
+
+    found_tracks = {}  # Keyed on track ID for O(1) dedup across queries
     seen_track_titles = set()  # Track titles we've already seen (for same artist)
-    
-    # Search for tracks by this artist (simple search)
-    search_queries = [
-        f"artist:{artist}",
-        f"{artist}",
-        f"{artist} 2025"  # Include current year for recency
-    ]
-    
-    for query in search_queries:
-        search_response = send_mcp_request(process, request_id, "tools/call", {
-            "name": "searchSpotify",
-            "arguments": {
-                "query": query,
-                "type": "track",
-                "limit": 50  # Get more results to find recent ones
-            }
-        })
-        request_id += 1
-        
-        if search_response and "result" in search_response:
-            search_text = search_response["result"]["content"][0]["text"]
-            tracks = extract_track_info_with_dates(search_text)
-            
-            for track in tracks:
-                # Check if this track is actually by the artist we're looking for
-                if artist.lower() in track['artist'].lower():
-                    # Check if it's a recent release
-                    if is_recent_release(track['release_date'], cutoff_date):
-                        track_key = f"{track['title'].lower()}-{artist.lower()}"  # Normalize for comparison
-                        
-                        # Avoid duplicates using track ID and track title
-                        if track['id'] not in seen_track_ids and track_key not in seen_track_titles:
-                            found_tracks.append(track)
-                            seen_track_ids.add(track['id'])
-                            seen_track_titles.add(track_key)
-                            print(f"    ✅ Found recent release: \"{track['title']}\" (Released: {track['release_date']}) - ID: {track['id']}")
-                        elif track['id'] in seen_track_ids:
-                            print(f"    🔄 Duplicate ID: \"{track['title']}\" (Released: {track['release_date']}) - ID: {track['id']} already seen")
-                        elif track_key in seen_track_titles:
-                            print(f"    🔄 Same song: \"{track['title']}\" (Released: {track['release_date']}) - Different version, skipping")
-    
-    return found_tracks, request_id  # Return all found tracks
 
+    # Resolve the canonical artist name/ID once (persisted across runs);
+    # a quoted filter on the exact name is far more precise than the
+    # free-text fallback
+    resolved = await resolve_artist(client, limiter, artist, artist_cache)
+    artist_name = resolved['name'] if resolved else artist
+
+    # Search for tracks by this artist (simple search); dedupe in case
+    # the artist name makes two queries collide
+    search_queries = list(dict.fromkeys([
+        f'artist:"{artist_name}"' if resolved else f"artist:{artist}",
+        f"{artist_name}",
+        f"{artist_name} 2025"  # Include current year for recency
+    ]))
+
+    # Use the prebuilt matcher unless resolution changed the name
+    artist_matcher = _ARTIST_MATCHERS.get(artist)
+    if artist_matcher is None or artist_name != artist:
+        artist_matcher = re.compile(re.escape(artist_name.lower()))
+    artist_lower = artist.lower()
+
+    def iter_recent_tracks(search_text, artist_filtered):
+        """One fused pass over a response: extract, filter, dedupe.
+
+        Only tracks that survive every check get a dict built for them,
+        and the caller can stop pulling as soon as the cap is reached.
+        """
+        for match in _TRACK_RE.finditer(search_text):
+            # Check if this track is actually by the artist we're
+            # looking for (already guaranteed for artist: queries)
+            if not artist_filtered and not artist_matcher.search(match[2].lower()):
+                continue
+
+            track_id = match[4]
+            release_date = match[3]
+
+            # A track we already kept doesn't need its date re-checked
+            if track_id in found_tracks:
+                log_lines.append(f"    🔄 Duplicate ID: \"{match[1].strip()}\" (Released: {release_date}) - ID: {track_id} already seen")
+                continue
+
+            # Tracks a previous run already aged out can be skipped
+            # without any date work (a changed release date falls
+            # through and gets re-checked)
+            if known_old.get(track_id) == release_date:
+                continue
+
+            # Check if it's a recent release
+            if is_recent_release(release_date, cutoff_date, cutoff_ymd):
+                title = match[1].strip()
+                track_key = f"{title.lower()}-{artist_lower}"  # Normalize for comparison
+
+                # Avoid duplicates using track title
+                if track_key not in seen_track_titles:
+                    seen_track_titles.add(track_key)
+                    yield {
+                        'title': title,
+                        'artist': match[2].strip(),
+                        'release_date': release_date,
+                        'id': track_id
+                    }
+                else:
+                    log_lines.append(f"    🔄 Same song: \"{title}\" (Released: {release_date}) - Different version, skipping")
+            elif len(release_date) == 10:
+                # Remember old tracks so next week's run can skip them
+                # outright. Only full-precision dates below the cutoff
+                # are permanently old - a low-precision date rejected by
+                # the first-week short-circuit (e.g. a month-only
+                # pre-release) could still qualify under a later cutoff.
+                known_old[track_id] = release_date
+
+    async def run_query(query):
+        async with semaphore:
+            response = await search_spotify(client, limiter, query)
+        # Only the quoted artist: query is fully constrained server-side;
+        # the unquoted fallback binds just the next token, so multi-word
+        # names still need the client-side check
+        return query.startswith('artist:"'), response
+
+    # Fire all queries at once and stop as soon as we have enough tracks -
+    # the broader queries mostly re-rank the same results
+    tasks = [asyncio.create_task(run_query(query)) for query in search_queries]
+    try:
+        for completed in asyncio.as_completed(tasks):
+            artist_filtered, search_response = await completed
 
-def create_weekly_playlist():
+            if len(found_tracks) >= MAX_TRACKS_PER_ARTIST:
+                break
+
+            if search_response and "result" in search_response:
+                search_text = search_response["result"]["content"][0]["text"]
+                remaining = MAX_TRACKS_PER_ARTIST - len(found_tracks)
+
+                accepted = iter_recent_tracks(search_text, artist_filtered)
+                for track in itertools.islice(accepted, remaining):
+                    found_tracks[track['id']] = track
+                    log_lines.append(f"    ✅ Found recent release: \"{track['title']}\" (Released: {track['release_date']}) - ID: {track['id']}")
+
+    finally:
+        for task in tasks:
+            task.cancel()
+        # One buffered write per artist; no lock needed since the write
+        # happens synchronously between awaits
+        sys.stdout.write('\n'.join(log_lines) + '\n')
+
+    return list(found_tracks.values())  # Return all found tracks
+
+
+async def create_weekly_playlist():
     """Create a weekly playlist with songs released in the last 7 days."""
     print("🎵 Creating Weekly New Drops Playlist")
     print("=" * 50)
@@ -187,7 +516,10 @@ def create_weekly_playlist():
     for artist in FAVORITE_ARTISTS:
         print(f"   • {artist}")
     
+    # Compute the cutoff once so the whole run filters against the same
+    # instant (and skip re-deriving the tuple per track)
     cutoff_date = get_cutoff_date()
+    cutoff_ymd = (cutoff_date.year, cutoff_date.month, cutoff_date.day)
     print(f"\n📅 Looking for tracks released after {cutoff_date.strftime('%Y-%m-%d')} (last 7 days)")
     print("🔍 Using actual Spotify release date filtering")
     print()
@@ -203,21 +535,21 @@ def create_weekly_playlist():
     
     try:
         # Start the MCP server process
-        process = subprocess.Popen(
-            ["node", str(server_path)],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1
+        process = await asyncio.create_subprocess_exec(
+            "node", str(server_path),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=STREAM_LIMIT
         )
-        
+
         print("✅ Started MCP server")
-        
-        request_id = 1
-        
+
+        client = MCPClient(process)
+        client.start()
+
         # 1. Initialize connection
-        init_response = send_mcp_request(process, request_id, "initialize", {
+        init_response = await client.send_mcp_request("initialize", {
             "protocolVersion": "2024-11-05",
             "capabilities": {},
             "clientInfo": {
@@ -225,19 +557,18 @@ def create_weekly_playlist():
                 "version": "2.0.0"
             }
         })
-        request_id += 1
-        
+
         if not init_response or "result" not in init_response:
             print("❌ Failed to initialize connection")
             return False
-        
+
         print("✅ Connected to Spotify MCP server")
-        
+
         # 2. Create playlist
         playlist_name = generate_playlist_name()
         print(f"📝 Creating playlist: {playlist_name}")
-        
-        create_response = send_mcp_request(process, request_id, "tools/call", {
+
+        create_response = await client.send_mcp_request("tools/call", {
             "name": "createPlaylist",
             "arguments": {
                 "name": playlist_name,
@@ -245,8 +576,7 @@ def create_weekly_playlist():
                 "public": False
             }
         })
-        request_id += 1
-        
+
         if not create_response or "result" not in create_response:
             print("❌ Failed to create playlist")
             return False
@@ -261,22 +591,31 @@ def create_weekly_playlist():
         
         print(f"✅ Created playlist with ID: {playlist_id}")
         
-        # 3. Search for recent releases by each artist
+        # 3. Search for recent releases by each artist, all concurrently
         all_tracks = []
         track_ids_to_add = []
         final_seen_track_ids = set()  # Global deduplication across all artists
         final_seen_track_titles = set()  # Global track title deduplication
-        
-        for artist in FAVORITE_ARTISTS:
+
+        semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+        limiter = RateLimiter()
+        cache = load_cache()
+        results = await asyncio.gather(*[
+            search_artist_tracks(client, artist, semaphore, limiter,
+                                 cache['tracks'], cache['artists'],
+                                 cutoff_date, cutoff_ymd)
+            for artist in FAVORITE_ARTISTS
+        ])
+        save_cache(cache)
+
+        for artist, tracks in zip(FAVORITE_ARTISTS, results):
             print(f"\n🎤 Checking {artist} for tracks released in the last 7 days...")
-            
-            tracks, request_id = search_artist_tracks(process, request_id, artist)
-            
+
             if tracks:
                 artist_added_count = 0
                 print(f"  ✅ Found {len(tracks)} recent track(s):")
                 for track in tracks:
-                    track_key = f"{track['title'].lower()}"  # Just title for global dedup
+                    track_key = track['title'].lower()  # Just title for global dedup
                     
                     # Final deduplication check across all artists
                     if track['id'] not in final_seen_track_ids and track_key not in final_seen_track_titles:
@@ -300,15 +639,14 @@ def create_weekly_playlist():
         if track_ids_to_add:
             print(f"\n➕ Adding {len(track_ids_to_add)} recent tracks to playlist...")
             
-            add_response = send_mcp_request(process, request_id, "tools/call", {
+            add_response = await client.send_mcp_request("tools/call", {
                 "name": "addTracksToPlaylist",
                 "arguments": {
                     "playlistId": playlist_id,
                     "trackIds": track_ids_to_add
                 }
             })
-            request_id += 1
-            
+
             if add_response and "result" in add_response:
                 add_text = add_response["result"]["content"][0]["text"]
                 if "Successfully added" in add_text:
@@ -339,10 +677,20 @@ def create_weekly_playlist():
         
     finally:
         try:
-            process.terminate()
-            process.wait(timeout=5)
+            await client.close()
+            if process.stdin:
+                process.stdin.close()
+            # The server may already have exited (and been reaped), in
+            # which case there is nothing left to signal
+            if process.returncode is None:
+                process.terminate()
+                await asyncio.wait_for(process.wait(), timeout=5)
         except:
-            process.kill()
+            try:
+                if process.returncode is None:
+                    process.kill()
+            except ProcessLookupError:
+                pass
 
 
 def setup_automation_instructions():
@@ -372,8 +720,8 @@ if __name__ == "__main__":
     print()
     
     try:
-        success = create_weekly_playlist()
-        
+        success = asyncio.run(create_weekly_playlist())
+
         if success:
             setup_automation_instructions()
         else: